@@ -1,120 +1,371 @@
 #!/usr/bin/env python3
+from __future__ import annotations
+
 import click
-import requests
+import orjson
 import os
+import re
 import time
-import json
 import hashlib
-from typing import List, Optional, Dict, Any
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, BarColumn, DownloadColumn, TransferSpeedColumn, TextColumn
-
-console = Console()
+import shutil
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, ClassVar, List, Optional, Dict, Any, Tuple
+
+# rich, requests and requests-cache are imported where they are first used:
+# together they dominate startup, `--help` needs none of them and `remove` only the console
+if TYPE_CHECKING:
+    from requests_cache import CachedSession
+    from rich.progress import Progress, TaskID
+
+class _LazyConsole:
+    """Stands in for a rich Console, creating the real one on first use"""
+    _console = None
+
+    def resolve(self):
+        """Returns the real Console, for APIs that need the object itself"""
+        if _LazyConsole._console is None:
+            from rich.console import Console
+            _LazyConsole._console = Console()
+        return _LazyConsole._console
+
+    def __getattr__(self, name: str):
+        return getattr(self.resolve(), name)
+
+console = _LazyConsole()
+
+CACHE_DIR = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "apt-mc")
+
+# We assume users want spigot/paper plugins
+LOADERS = ["spigot", "paper", "purpur", "bukkit"]
+_LOADERS_JSON = orjson.dumps(LOADERS).decode()
+_FACETS = '[["project_type:plugin"], ["categories:spigot", "categories:paper", "categories:purpur", "categories:bukkit"]]'
+
+def _create_session() -> CachedSession:
+    """Build a keep-alive session shared by every API call and download.
+
+    API responses are cached on disk and revalidated according to Modrinth's
+    Cache-Control/ETag headers; downloads bypass the cache entirely.
+    """
+    from requests.adapters import HTTPAdapter
+    from requests_cache import EXPIRE_IMMEDIATELY, CachedSession
+    from urllib3.util.retry import Retry
+
+    session = CachedSession(
+        cache_name=os.path.join(CACHE_DIR, "http"),
+        backend="sqlite",
+        cache_control=True,
+        expire_after=600,
+        # Version listings decide what gets upgraded, so always revalidate them;
+        # with an ETag that is a conditional request answered by a bodyless 304
+        urls_expire_after={
+            f"{ModrinthAPI.BASE_URL}/project/*/version": EXPIRE_IMMEDIATELY,
+            f"{ModrinthAPI.BASE_URL}/version_files/update": EXPIRE_IMMEDIATELY
+        },
+        # get_versions_by_hashes is a POST; its JSON body is part of the cache key
+        allowable_methods=("GET", "POST"),
+        # Never copy plugin jars into the cache
+        filter_fn=lambda response: response.url.startswith(ModrinthAPI.BASE_URL)
+    )
+    session.headers.update(ModrinthAPI.HEADERS)
+    # One bounded keep-alive pool per host: concurrent workers wait for a free
+    # connection instead of opening throwaway ones the pool would discard
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        pool_block=True,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            # version_files is a read-only lookup, so it is safe to retry too
+            allowed_methods=frozenset({"GET", "POST"})
+        )
+    )
+    session.mount("https://", adapter)
+    return session
 
 class ModrinthAPI:
     BASE_URL = "https://api.modrinth.com/v2"
     HEADERS = {"User-Agent": "apt-mc/1.0 (parody-cli)"}
+    _session: ClassVar[Optional[CachedSession]] = None
+    _session_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @staticmethod
+    def _get_session() -> CachedSession:
+        """Returns the shared session, creating it on first use"""
+        if ModrinthAPI._session is None:
+            # The first calls may come from several worker threads at once
+            with ModrinthAPI._session_lock:
+                if ModrinthAPI._session is None:
+                    ModrinthAPI._session = _create_session()
+        return ModrinthAPI._session
 
     @staticmethod
     def search(query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        facets = '[["project_type:plugin"], ["categories:spigot", "categories:paper", "categories:purpur", "categories:bukkit"]]'
-        response = requests.get(
-            f"{ModrinthAPI.BASE_URL}/search",
-            params={"query": query, "facets": facets, "limit": limit},
-            headers=ModrinthAPI.HEADERS
+        response = ModrinthAPI._get_session().get(
+            _SEARCH_URL,
+            params=(("query", query), ("facets", _FACETS), ("limit", limit))
         )
         response.raise_for_status()
-        return response.json().get("hits", [])
+        return orjson.loads(response.content).get("hits", [])
 
     @staticmethod
     def get_project(project_id_or_slug: str) -> Optional[Dict[str, Any]]:
-        response = requests.get(
-            f"{ModrinthAPI.BASE_URL}/project/{project_id_or_slug}",
-            headers=ModrinthAPI.HEADERS
+        response = ModrinthAPI._get_session().get(
+            f"{ModrinthAPI.BASE_URL}/project/{project_id_or_slug}"
         )
         if response.status_code == 404:
             return None
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+
+    @staticmethod
+    def get_projects(project_ids: List[str]) -> List[Dict[str, Any]]:
+        if not project_ids:
+            return []
+        res = ModrinthAPI._get_session().get(
+            f"{ModrinthAPI.BASE_URL}/projects",
+            params={"ids": orjson.dumps(project_ids).decode()}
+        )
+        res.raise_for_status()
+        return orjson.loads(res.content)
 
     @staticmethod
     def get_versions(project_id: str, loaders: List[str]) -> List[Dict[str, Any]]:
-        res = requests.get(
+        res = ModrinthAPI._get_session().get(
             f"{ModrinthAPI.BASE_URL}/project/{project_id}/version",
-            params={"loaders": json.dumps(loaders)},
-            headers=ModrinthAPI.HEADERS
+            params={"loaders": _LOADERS_JSON if loaders == LOADERS else orjson.dumps(loaders).decode()}
         )
         res.raise_for_status()
-        return res.json()
+        return orjson.loads(res.content)
 
     @staticmethod
     def get_versions_by_hashes(hashes: List[str]) -> Dict[str, Any]:
         if not hashes:
             return {}
-        res = requests.post(
+        res = ModrinthAPI._get_session().post(
             f"{ModrinthAPI.BASE_URL}/version_files",
-            json={"hashes": hashes, "algorithm": "sha1"},
-            headers=ModrinthAPI.HEADERS
+            json={"hashes": hashes, "algorithm": "sha1"}
         )
         res.raise_for_status()
-        return res.json()
+        return orjson.loads(res.content)
+
+    @staticmethod
+    def get_latest_versions_by_hashes(hashes: List[str], loaders: List[str]) -> Dict[str, Any]:
+        """Returns a dict of sha1 -> latest compatible version of the project that file belongs to"""
+        if not hashes:
+            return {}
+        res = ModrinthAPI._get_session().post(
+            f"{ModrinthAPI.BASE_URL}/version_files/update",
+            json={"hashes": hashes, "algorithm": "sha1", "loaders": loaders}
+        )
+        res.raise_for_status()
+        return orjson.loads(res.content)
 
     @staticmethod
     def get_members(project_id_or_slug: str) -> List[Dict[str, Any]]:
-        res = requests.get(
-            f"{ModrinthAPI.BASE_URL}/project/{project_id_or_slug}/members",
-            headers=ModrinthAPI.HEADERS
+        res = ModrinthAPI._get_session().get(
+            f"{ModrinthAPI.BASE_URL}/project/{project_id_or_slug}/members"
         )
         res.raise_for_status()
-        return res.json()
+        return orjson.loads(res.content)
+
+_SEARCH_URL = f"{ModrinthAPI.BASE_URL}/search"
+
+class HashCache:
+    """Persistent (path, mtime, size) -> sha1 store so unchanged jars are never re-hashed"""
+
+    def __init__(self, db_path: str = os.path.join(CACHE_DIR, "hashes.db")):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None:
+            try:
+                os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+                conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                conn.execute("CREATE TABLE IF NOT EXISTS hashes(path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, sha1 TEXT)")
+                self._conn = conn
+            except (OSError, sqlite3.Error):
+                # An unusable cache only costs us the re-hash
+                return None
+        return self._conn
+
+    def get(self, path: str, mtime: int, size: int) -> Optional[str]:
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT sha1 FROM hashes WHERE path = ? AND mtime = ? AND size = ?",
+                    (path, mtime, size)
+                ).fetchone()
+            except sqlite3.Error:
+                # e.g. locked by another apt-mc or damaged: treat as a miss
+                return None
+        return row[0] if row else None
+
+    def put(self, path: str, sha1: str):
+        """Stores the sha1 of a file that was just written"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return
+        self.put_many([(os.path.abspath(path), st.st_mtime_ns, st.st_size, sha1)])
+
+    def put_many(self, rows: List[Tuple[str, int, int, str]]):
+        """Stores (path, mtime, size, sha1) rows in a single transaction"""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT INTO hashes(path, mtime, size, sha1) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT(path) DO UPDATE SET mtime = excluded.mtime, size = excluded.size, sha1 = excluded.sha1",
+                        rows
+                    )
+            except sqlite3.Error:
+                # Dropping the write only costs a re-hash next time
+                pass
+
+def _download_progress() -> Progress:
+    """One progress display shared by every download in a command, one task per file"""
+    from rich.progress import Progress, BarColumn, DownloadColumn, TransferSpeedColumn, TextColumn
+
+    return Progress(
+        TextColumn("[bold blue]{task.fields[filename]}", justify="right"),
+        BarColumn(bar_width=None),
+        "[progress.percentage]{task.percentage:>3.1f}%",
+        "•", DownloadColumn(), "•", TransferSpeedColumn(), "•",
+        TextColumn("[green]Done[/green]"),
+        console=console.resolve()
+    )
+
+class _ProgressReader:
+    """Wraps a readable stream, hashing and reporting bytes read to a progress task"""
+
+    def __init__(self, raw, progress: Progress, task: TaskID):
+        self._raw = raw
+        self._progress = progress
+        self._task = task
+        self._pending = 0
+        self.sha1 = hashlib.sha1()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._raw.read(size)
+        self.sha1.update(data)
+        self._pending += len(data)
+        # Redrawing the bar dominates CPU on fast links, so only report every 256 KiB
+        if self._pending >= 1 << 18 or not data:
+            self._progress.update(self._task, advance=self._pending)
+            self._pending = 0
+        return data
 
 class PackageManager:
     def __init__(self, plugins_dir: str = "plugins"):
         self.plugins_dir = plugins_dir
+        self._hash_cache = HashCache()
 
     def ensure_dir(self):
-        if not os.path.exists(self.plugins_dir):
-            os.makedirs(self.plugins_dir)
+        os.makedirs(self.plugins_dir, exist_ok=True)
 
-    def download_file(self, url: str, filename: str, size: int):
+    def download_file(self, url: str, filename: str, size: int, progress: Progress):
         dest_path = os.path.join(self.plugins_dir, filename)
-        with requests.get(url, stream=True, headers=ModrinthAPI.HEADERS) as r:
+        with ModrinthAPI._get_session().get(url, stream=True) as r:
             r.raise_for_status()
-            with Progress(
-                TextColumn("[bold blue]{task.fields[filename]}", justify="right"),
-                BarColumn(bar_width=None),
-                "[progress.percentage]{task.percentage:>3.1f}%",
-                "•", DownloadColumn(), "•", TransferSpeedColumn(), "•",
-                TextColumn("[green]Done[/green]"),
-                console=console
-            ) as progress:
-                task = progress.add_task("download", filename=filename, total=size)
-                with open(dest_path, "wb") as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                        progress.update(task, advance=len(chunk))
+            task = progress.add_task("download", filename=filename, total=size)
+            # Copy the raw stream in 1 MiB blocks instead of iterating small chunks
+            r.raw.decode_content = True
+            # Write to a side file so a failed download never looks like an installed jar
+            part_path = dest_path + ".part"
+            try:
+                with open(part_path, "wb", buffering=1 << 20) as f:
+                    if size and hasattr(os, "posix_fallocate"):
+                        try:
+                            # Reserve the blocks up front to keep the jar contiguous on disk
+                            os.posix_fallocate(f.fileno(), 0, size)
+                        except OSError:
+                            pass
+                    reader = _ProgressReader(r.raw, progress, task)
+                    shutil.copyfileobj(reader, f, length=1 << 20)
+                    # Drop any preallocated tail if the server sent less than advertised
+                    f.truncate()
+                os.replace(part_path, dest_path)
+            except BaseException:
+                try:
+                    os.remove(part_path)
+                except FileNotFoundError:
+                    pass
+                raise
+        # Hashed on the way in, so the next list/upgrade does not have to re-read the jar
+        self._hash_cache.put(dest_path, reader.sha1.hexdigest())
+
+    def download_files(self, files: List[Dict[str, Any]], progress: Progress, max_workers: int = 4) -> Dict[str, Exception]:
+        """Downloads Modrinth file objects concurrently. Returns a dict of filename -> error for failed downloads"""
+        errors = {}
+        # Small jars rarely saturate the link on their own, so overlap a few at a time
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(self.download_file, f["url"], f["filename"], f["size"], progress): f["filename"]
+                for f in files
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors[futures[future]] = e
+        return errors
 
     def calculate_sha1(self, filepath: str) -> str:
-        sha1 = hashlib.sha1()
         with open(filepath, 'rb') as f:
-            while True:
-                data = f.read(65536)
-                if not data:
-                    break
-                sha1.update(data)
-        return sha1.hexdigest()
+            try:
+                # Python 3.11+: hashing loop runs in C, using OpenSSL's SHA extensions where available
+                return hashlib.file_digest(f, 'sha1').hexdigest()
+            except AttributeError:
+                sha1 = hashlib.sha1()
+                while True:
+                    data = f.read(1 << 20)
+                    if not data:
+                        break
+                    sha1.update(data)
+                return sha1.hexdigest()
 
     def get_installed_plugins(self) -> Dict[str, str]:
         """Returns a dict of filename -> sha1"""
-        if not os.path.exists(self.plugins_dir):
+        try:
+            it = os.scandir(self.plugins_dir)
+        except FileNotFoundError:
             return {}
         
         plugins = {}
-        for f in os.listdir(self.plugins_dir):
-            if f.endswith(".jar"):
-                full_path = os.path.join(self.plugins_dir, f)
-                plugins[f] = self.calculate_sha1(full_path)
+        misses = []
+        with it:
+            for entry in it:
+                if not entry.name.endswith(".jar"):
+                    continue
+                st = entry.stat()
+                path = os.path.abspath(entry.path)
+                sha1 = self._hash_cache.get(path, st.st_mtime_ns, st.st_size)
+                if sha1:
+                    plugins[entry.name] = sha1
+                else:
+                    misses.append((entry.name, path, st))
+
+        if misses:
+            # hashlib releases the GIL while hashing, so threads spread jars across cores
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+                digests = list(pool.map(self.calculate_sha1, [path for _, path, _ in misses]))
+            self._hash_cache.put_many([
+                (path, st.st_mtime_ns, st.st_size, sha1)
+                for (_, path, st), sha1 in zip(misses, digests)
+            ])
+            plugins.update((name, sha1) for (name, _, _), sha1 in zip(misses, digests))
         return plugins
 
 @click.group()
@@ -180,7 +431,7 @@ def info(package):
 
         try:
 
-            versions = ModrinthAPI.get_versions(project['id'], ["spigot", "paper", "purpur", "bukkit"])
+            versions = ModrinthAPI.get_versions(project['id'], LOADERS)
 
             if versions:
 
@@ -194,29 +445,17 @@ def info(package):
 
                 if req_deps:
 
-                    dep_names = []
-
-                    for dep_id in req_deps:
-
-                        # Best effort name resolution
-
-                        try:
-
-                            dep_proj = ModrinthAPI.get_project(dep_id)
-
-                            if dep_proj:
-
-                                dep_names.append(dep_proj['slug'])
+                    # Best effort name resolution, one request for all dependencies
 
-                            else:
+                    try:
 
-                                dep_names.append(dep_id)
+                        slugs = {p['id']: p['slug'] for p in ModrinthAPI.get_projects(req_deps)}
 
-                        except:
+                    except:
 
-                            dep_names.append(dep_id)
+                        slugs = {}
 
-                    dependencies = ", ".join(dep_names)
+                    dependencies = ", ".join(slugs.get(dep_id, dep_id) for dep_id in req_deps)
 
         except:
 
@@ -317,6 +556,8 @@ def list_packages(installed):
         
     sha1_to_filename = {v: k for k, v in installed_plugins.items()}
     
+    from rich.table import Table
+
     table = Table(box=None, show_header=False, padding=(0, 2))
     table.add_column("Package", style="green")
     table.add_column("Version")
@@ -373,10 +614,13 @@ def list_packages(installed):
 @cli.command()
 def update():
     """Update list of available packages."""
+    # The spinner is pure theatre; only play it when asked to
+    animate = bool(os.environ.get("APT_MC_ANIMATE"))
     for i, loader in enumerate(["spigot", "paper", "purpur"], 1):
-        with console.status(f"[bold white]Hit:{i} https://api.modrinth.com/v2/search {loader}[/bold white]"):
-            time.sleep(0.3)
-            console.print(f"Hit:{i} https://api.modrinth.com/v2/search {loader}")
+        if animate:
+            with console.status(f"[bold white]Hit:{i} https://api.modrinth.com/v2/search {loader}[/bold white]"):
+                time.sleep(0.3)
+        console.print(f"Hit:{i} https://api.modrinth.com/v2/search {loader}")
     
     console.print("Reading package lists... [green]Done[/green]")
     console.print("Building dependency tree... [green]Done[/green]")
@@ -396,6 +640,8 @@ def search(query):
             console.print(f"No plugins found for '{query}'.")
             return
 
+        from rich.table import Table
+
         table = Table(show_header=True, header_style="bold magenta")
         table.add_column("Package Name", style="green")
         table.add_column("Description")
@@ -424,10 +670,13 @@ def install(packages):
     console.print("Reading package lists... [green]Done[/green]")
     console.print("Building dependency tree... [green]Done[/green]")
     
+    # Resolve all packages concurrently; map() keeps the results in argument order
+    with ThreadPoolExecutor(max_workers=min(8, len(packages))) as pool:
+        projects = list(pool.map(ModrinthAPI.get_project, packages))
+
     to_install = []
-    for pkg_slug in packages:
+    for pkg_slug, project in zip(packages, projects):
         console.print(f"Check {pkg_slug}...")
-        project = ModrinthAPI.get_project(pkg_slug)
         if project:
             to_install.append(project)
         else:
@@ -442,19 +691,29 @@ def install(packages):
     
     console.print(f"\n0 upgraded, {len(to_install)} newly installed, 0 to remove and 0 not upgraded.")
     
+    downloads = {}
     for pkg in to_install:
         try:
-            versions = ModrinthAPI.get_versions(pkg['id'], ["spigot", "paper", "purpur", "bukkit"])
+            versions = ModrinthAPI.get_versions(pkg['id'], LOADERS)
             if not versions:
                 console.print(f"[red]E: No compatible versions for {pkg['slug']}[/red]")
                 continue
             
             latest = versions[0]
             primary_file = next((f for f in latest["files"] if f.get("primary")), latest["files"][0])
-            pm.download_file(primary_file["url"], primary_file["filename"], primary_file["size"])
+            if primary_file["filename"] in downloads:
+                other = downloads[primary_file["filename"]][0]
+                console.print(f"[red]E: Unable to install {pkg['slug']}: {primary_file['filename']} is also provided by {other['slug']}[/red]")
+                continue
+            downloads[primary_file["filename"]] = (pkg, primary_file)
         except Exception as e:
             console.print(f"[red]E: Failed to install {pkg['slug']}: {e}[/red]")
 
+    with _download_progress() as progress:
+        errors = pm.download_files([f for _, f in downloads.values()], progress)
+    for filename, e in errors.items():
+        console.print(f"[red]E: Failed to install {downloads[filename][0]['slug']}: {e}[/red]")
+
 @cli.command()
 def upgrade():
     """Upgrade installed plugins."""
@@ -471,10 +730,12 @@ def upgrade():
         console.print("0 upgraded, 0 newly installed, 0 to remove and 0 not upgraded.")
         return
 
-    # Bulk lookup hashes
+    # Bulk lookup hashes: the installed versions, and the latest compatible version
+    # of each project. Two requests no matter how many plugins are installed.
     hashes = list(installed.values())
     try:
         versions_map = ModrinthAPI.get_versions_by_hashes(hashes)
+        latest_map = ModrinthAPI.get_latest_versions_by_hashes(hashes, LOADERS)
     except Exception as e:
         console.print(f"[red]E: Failed to check for updates: {e}[/red]")
         return
@@ -485,33 +746,20 @@ def upgrade():
     sha1_to_filename = {v: k for k, v in installed.items()}
 
     for file_sha1, version_info in versions_map.items():
-        if not version_info:
-            continue
-            
-        project_id = version_info['project_id']
-        current_version_id = version_info['id']
-        
-        # Check for latest version of this project
-        try:
-            # We assume users want spigot/paper plugins
-            available_versions = ModrinthAPI.get_versions(project_id, ["spigot", "paper", "purpur", "bukkit"])
-            if not available_versions:
-                continue
-                
-            latest = available_versions[0]
-            
-            if latest['id'] != current_version_id:
-                filename = sha1_to_filename.get(file_sha1, "Unknown")
-                updates.append({
-                    "filename": filename,
-                    "project_id": project_id,
-                    "current_version": version_info['version_number'],
-                    "new_version": latest['version_number'],
-                    "latest_obj": latest
-                })
-        except Exception:
+        latest = latest_map.get(file_sha1)
+        if not version_info or not latest:
             continue
 
+        if latest['id'] != version_info['id']:
+            filename = sha1_to_filename.get(file_sha1, "Unknown")
+            updates.append({
+                "filename": filename,
+                "project_id": version_info['project_id'],
+                "current_version": version_info['version_number'],
+                "new_version": latest['version_number'],
+                "latest_obj": latest
+            })
+
     console.print("[green]Done[/green]")
 
     if not updates:
@@ -532,6 +780,7 @@ def upgrade():
         console.print("Abort.")
         return
 
+    downloads = {}
     for up in updates:
         latest = up['latest_obj']
         files = latest.get("files", [])
@@ -539,42 +788,66 @@ def upgrade():
             continue
             
         primary_file = next((f for f in files if f.get("primary")), files[0])
-        
-        # Remove old file
-        old_path = os.path.join(pm.plugins_dir, up['filename'])
-        if os.path.exists(old_path):
-            os.remove(old_path)
+        if primary_file["filename"] in downloads:
+            other = downloads[primary_file["filename"]][0]
+            console.print(f"[red]E: Unable to upgrade {up['filename']}: {primary_file['filename']} is also provided by {other['filename']}[/red]")
+            continue
+        downloads[primary_file["filename"]] = (up, primary_file)
             
-        # Download new
+    # Download new
+    with _download_progress() as progress:
+        errors = pm.download_files([f for _, f in downloads.values()], progress)
+    for filename, e in errors.items():
+        console.print(f"[red]E: Failed to upgrade {downloads[filename][0]['filename']}: {e}[/red]")
+
+    # Remove old files only once their replacement has landed
+    for filename, (up, _) in downloads.items():
+        if filename in errors or filename == up['filename']:
+            continue
         try:
-            pm.download_file(primary_file["url"], primary_file["filename"], primary_file["size"])
-        except Exception as e:
-             console.print(f"[red]E: Failed to upgrade {up['filename']}: {e}[/red]")
+            os.remove(os.path.join(pm.plugins_dir, up['filename']))
+        except FileNotFoundError:
+            pass
 
 @cli.command()
-@click.argument("package")
-def remove(package):
-    """Remove a plugin."""
+@click.argument("packages", nargs=-1)
+def remove(packages):
+    """Remove plugins."""
+    if not packages:
+        console.print("[red]E: No packages specified.[/red]")
+        return
+
     console.print(f"Reading package lists... [green]Done[/green]")
     console.print(f"Building dependency tree... [green]Done[/green]")
     
     pm = PackageManager()
-    if not os.path.exists(pm.plugins_dir):
-        console.print(f"[red]E: Unable to locate package {package}[/red]")
-        return
-        
-    candidates = [f for f in os.listdir(pm.plugins_dir) if f.endswith(".jar") and package.lower() in f.lower()]
-    if not candidates:
-        console.print(f"[red]E: Unable to locate package {package}[/red]")
-        return
-        
-    if len(candidates) > 1:
-        console.print(f"[red]E: Multiple candidates found for {package}. Be more specific.[/red]")
+    try:
+        it = os.scandir(pm.plugins_dir)
+    except FileNotFoundError:
+        for package in packages:
+            console.print(f"[red]E: Unable to locate package {package}[/red]")
         return
-        
-    target = candidates[0]
-    os.remove(os.path.join(pm.plugins_dir, target))
-    console.print(f"Removing {package} ({target})...")
+
+    # Narrow the directory down to jars matching any requested package in one pass
+    pattern = re.compile("|".join(re.escape(p) for p in packages), re.IGNORECASE)
+    with it:
+        matches = [e for e in it if e.name.endswith(".jar") and pattern.search(e.name)]
+
+    for package in dict.fromkeys(packages):
+        pkg_lower = package.lower()
+        candidates = [e for e in matches if pkg_lower in e.name.lower()]
+        if not candidates:
+            console.print(f"[red]E: Unable to locate package {package}[/red]")
+            continue
+            
+        if len(candidates) > 1:
+            console.print(f"[red]E: Multiple candidates found for {package}. Be more specific.[/red]")
+            continue
+            
+        target = candidates[0]
+        os.remove(target.path)
+        matches.remove(target)
+        console.print(f"Removing {package} ({target.name})...")
 
 if __name__ == "__main__":
     cli()